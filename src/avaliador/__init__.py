@@ -5,9 +5,21 @@ Ferramenta CLI para auditoria automatizada de qualidade de documentacoes
 de projetos TOTVS (MITs - Metodologia de Implantacao TOTVS).
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "AJoao-totvs"
 
-from avaliador.config import settings
+if TYPE_CHECKING:
+    from avaliador.config import settings  # noqa: F401
 
 __all__ = ["settings", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve `settings` (PEP 562) so importing the package stays cheap."""
+    if name == "settings":
+        from avaliador.config import settings
+
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,44 +1,188 @@
 """
 Cache manager for document extractions.
 
-Uses file-based caching with SHA256 hash of document content as key.
+Entries are keyed by a (path, size, mtime) fingerprint of the document (or
+a content hash with verify_hash=True) and stored either as one JSON file
+per entry (default) or in a single SQLite database in WAL mode
+(CACHE_BACKEND=sqlite), which avoids per-entry file opens and dentry
+pressure when many documents are cached.
 """
 
 import hashlib
 import json
+import os
+import sqlite3
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from avaliador.config import settings
-from avaliador.models.schemas import ExtractionResult
+
+try:
+    # Optional: BLAKE3 is considerably faster than SHA-256 for cache keying.
+    # Install with: pip install avaliador[perf]
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    # Optional: orjson serializes/parses JSON several times faster than the
+    # stdlib and works directly with UTF-8 bytes. Part of the 'perf' extra.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: zstd compression cuts cached-extraction size 2-4x (JSON with
+    # repeated keys compresses well) and decompresses faster than the disk
+    # can deliver the uncompressed bytes. Part of the 'perf' extra.
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Frame magic emitted by every zstd compressor; lets get() recognize
+# compressed entries regardless of filename.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Read size for file hashing (1 MiB). Large buffers keep the loop short and
+# let the hash run at full throughput on typical .docx inputs.
+HASH_CHUNK_SIZE = 1 << 20
+
+# Cache files are keyed by hash; the suffix encodes the algorithm so that
+# BLAKE3-keyed entries never collide with older SHA-256-keyed ones.
+CACHE_SUFFIX = ".blake3.json" if blake3 is not None else ".json"
 
 
 class CacheManager:
     """Manages caching of document extractions."""
 
-    def __init__(self, cache_dir: Optional[Path] = None):
+    def __init__(self, cache_dir: Optional[Path] = None, verify_hash: bool = False):
         """
         Initialize cache manager.
 
         Args:
             cache_dir: Directory for cache storage. Defaults to settings.cache_dir.
+            verify_hash: Key the cache by content hash instead of the default
+                (size, mtime) fingerprint. Slower, but detects files restored
+                with an old mtime.
         """
         self.cache_dir = cache_dir or settings.cache_dir
         self.enabled = settings.cache_enabled
+        self.verify_hash = verify_hash
+        self.backend = settings.cache_backend
+        self._db: Optional[sqlite3.Connection] = None
+        # Create the cache directory once up front; _get_cache_path runs on
+        # every get()/save() and should not pay a stat+mkdir syscall each time.
+        self._cache_dir_ready = False
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir_ready = True
+        # Plain-string form of the cache dir for the hot path: building
+        # "{dir}/{key}" by f-string skips two Path allocations per call.
+        self._cache_dir_str = os.fspath(self.cache_dir)
+        # Memoized hashes keyed by path -> (st_mtime_ns, st_size, hash).
+        # Avoids re-hashing the same file when get() and save() run
+        # back-to-back in a single evaluation.
+        self._hash_cache: dict[str, tuple[int, int, str]] = {}
+        # In-process memo of extractions keyed by cache key, so repeated
+        # lookups for the same file skip the disk read and JSON parse.
+        self._memo: dict[str, dict] = {}
+        # Long-lived (de)compressor instances amortize zstd context setup.
+        if zstandard is not None:
+            self._zstd_compressor = zstandard.ZstdCompressor(level=3)
+            self._zstd_decompressor = zstandard.ZstdDecompressor()
+        else:
+            self._zstd_compressor = None
+            self._zstd_decompressor = None
 
     def _get_file_hash(self, file_path: Path) -> str:
-        """Generate SHA256 hash of file content."""
+        """
+        Generate SHA256 hash of file content.
+
+        Results are memoized per (path, mtime, size) so that the typical
+        get() + save() sequence hashes the file only once. The memo entry
+        is invalidated automatically when the file changes on disk.
+        """
+        stat = file_path.stat()
+        key = str(file_path)
+        cached = self._hash_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        file_hash = self._compute_file_hash(file_path)
+        self._hash_cache[key] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
+    @staticmethod
+    def _compute_file_hash(file_path: Path) -> str:
+        """
+        Compute content hash of a file (uncached).
+
+        Uses BLAKE3 (multi-threaded, memory-mapped) when available,
+        falling back to SHA-256 otherwise. The hash is only a cache key,
+        so cryptographic strength is not required.
+        """
+        if blake3 is not None:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            try:
+                hasher.update_mmap(file_path)
+            except (OSError, ValueError):
+                # mmap can fail for empty or special files; fall back to reads
+                with open(file_path, "rb") as f:
+                    while chunk := f.read(HASH_CHUNK_SIZE):
+                        hasher.update(chunk)
+            return hasher.hexdigest()
+
         sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
+            # Large reads amortize Python-level loop overhead and let hashlib
+            # release the GIL while digesting each buffer.
+            while chunk := f.read(HASH_CHUNK_SIZE):
                 sha256.update(chunk)
         return sha256.hexdigest()
 
-    def _get_cache_path(self, file_hash: str) -> Path:
-        """Get cache file path for a given hash."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        return self.cache_dir / f"{file_hash}.json"
+    def _get_cache_key(self, file_path: Path) -> str:
+        """
+        Get cache key (filename) for a document.
+
+        By default the key is a (path, size, mtime) fingerprint, which costs
+        a single stat call instead of reading and hashing the whole file.
+        With verify_hash=True the key is the full content hash.
+        """
+        if self.verify_hash:
+            return f"{self._get_file_hash(file_path)}{CACHE_SUFFIX}"
+        stat = file_path.stat()
+        # Mix the (absolute) path into the key: size+mtime alone collide for
+        # distinct documents restored with matching timestamps (cp -p,
+        # unzip), which would serve one file's extraction for the other.
+        # crc32 keeps the key stable across processes, unlike the salted
+        # built-in hash().
+        path_crc = zlib.crc32(os.fspath(file_path.absolute()).encode())
+        return f"{path_crc:08x}-{stat.st_size:x}-{stat.st_mtime_ns:x}.json"
+
+    def _get_cache_path(self, cache_key: str) -> str:
+        """Get cache file path (as a plain string) for a given cache key."""
+        if not self._cache_dir_ready:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_dir_ready = True
+        return f"{self._cache_dir_str}{os.sep}{cache_key}"
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Lazily open the SQLite store, enabling WAL mode on first use."""
+        if self._db is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.cache_dir / "cache.db", isolation_level=None)
+            # WAL allows concurrent readers during writes; synchronous=NORMAL
+            # skips the fsync-per-commit that FULL would pay (cache loss on
+            # power failure is acceptable here).
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, blob BLOB NOT NULL)"
+            )
+        return self._db
 
     def get(self, file_path: Path) -> Optional[dict]:
         """
@@ -53,16 +197,52 @@ class CacheManager:
         if not self.enabled:
             return None
 
-        file_hash = self._get_file_hash(file_path)
-        cache_path = self._get_cache_path(file_hash)
+        cache_key = self._get_cache_key(file_path)
+
+        memoized = self._memo.get(cache_key)
+        if memoized is not None:
+            return memoized
+
+        if self.backend == "sqlite":
+            row = (
+                self._get_db()
+                .execute("SELECT blob FROM cache WHERE key = ?", (cache_key,))
+                .fetchone()
+            )
+            if row is None:
+                return None
+            try:
+                extraction = self._decode(row[0])
+            except ValueError:
+                self._get_db().execute("DELETE FROM cache WHERE key = ?", (cache_key,))
+                return None
+            self._memo[cache_key] = extraction
+            return extraction
 
-        if cache_path.exists():
+        # Compressed entries live next to plain ones (mixed caches happen
+        # when zstandard is installed later); try the preferred form first.
+        plain_path = self._get_cache_path(cache_key)
+        zst_path = plain_path + ".zst"
+        candidates = (zst_path, plain_path) if zstandard is not None else (plain_path, zst_path)
+        for cache_path in candidates:
+            # Opening directly (instead of exists() + read) also saves the
+            # extra stat syscall per lookup.
+            try:
+                with open(cache_path, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                continue
             try:
-                return json.loads(cache_path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
+                # Parse raw bytes directly: both orjson and stdlib json accept
+                # UTF-8 bytes, so the intermediate str decode/copy of
+                # read_text() is skipped entirely.
+                extraction = self._decode(raw)
+            except (ValueError, OSError):
                 # Invalid cache, remove it
-                cache_path.unlink(missing_ok=True)
+                self._unlink_quiet(cache_path)
                 return None
+            self._memo[cache_key] = extraction
+            return extraction
         return None
 
     def save(self, file_path: Path, extraction: dict) -> None:
@@ -76,20 +256,78 @@ class CacheManager:
         if not self.enabled:
             return
 
-        file_hash = self._get_file_hash(file_path)
-        cache_path = self._get_cache_path(file_hash)
+        cache_key = self._get_cache_key(file_path)
 
-        # Add cache metadata
-        extraction["_cache_metadata"] = {
+        # Attach cache metadata without mutating the caller's dict. The
+        # shallow copy only rebinds the handful of top-level keys; the
+        # extraction payload itself is shared, not duplicated.
+        payload = dict(extraction)
+        payload["_cache_metadata"] = {
             "cached_at": datetime.now().isoformat(),
             "source_file": str(file_path),
-            "file_hash": file_hash,
+            "cache_key": cache_key,
         }
 
-        cache_path.write_text(
-            json.dumps(extraction, ensure_ascii=False, indent=2, default=str),
-            encoding="utf-8",
-        )
+        if self.backend == "sqlite":
+            self._get_db().execute(
+                "INSERT OR REPLACE INTO cache (key, blob) VALUES (?, ?)",
+                (cache_key, self._encode(payload)),
+            )
+            self._memo[cache_key] = payload
+            return
+
+        # Write to a temp file and atomically rename so a crash mid-write
+        # never leaves a truncated cache entry (which get() would otherwise
+        # have to detect, delete and re-extract). No fsync: losing a cache
+        # entry on power failure is tolerable, a corrupt one is not.
+        cache_path = self._get_cache_path(cache_key)
+        if self._zstd_compressor is not None:
+            cache_path += ".zst"
+        tmp_path = cache_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(self._encode(payload))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            self._unlink_quiet(tmp_path)
+            raise
+
+        self._memo[cache_key] = payload
+
+    def _encode(self, payload: dict) -> bytes:
+        """Serialize (and, when zstd is available, compress) a cache payload."""
+        data = self._serialize(payload)
+        if self._zstd_compressor is not None:
+            data = self._zstd_compressor.compress(data)
+        return data
+
+    def _decode(self, raw: bytes) -> dict:
+        """Parse a cache entry, transparently decompressing zstd frames."""
+        if raw[:4] == _ZSTD_MAGIC:
+            if self._zstd_decompressor is None:
+                raise ValueError("cache entry is zstd-compressed but zstandard is not installed")
+            raw = self._zstd_decompressor.decompress(raw)
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    @staticmethod
+    def _serialize(extraction: dict) -> bytes:
+        """
+        Serialize an extraction to compact UTF-8 JSON bytes.
+
+        Encoding once and writing bytes skips the TextIOWrapper layer; the
+        compact form halves bytes written versus pretty-printing. Set
+        CACHE_PRETTY_JSON=true to get indented output for debugging.
+        """
+        pretty = settings.cache_pretty_json
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(extraction, option=option, default=str)
+        return json.dumps(
+            extraction,
+            ensure_ascii=False,
+            indent=2 if pretty else None,
+            default=str,
+        ).encode("utf-8")
 
     def clear(self) -> int:
         """
@@ -98,31 +336,56 @@ class CacheManager:
         Returns:
             Number of cache files removed.
         """
-        count = 0
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
-                count += 1
-        return count
+        self._memo.clear()
+        if not self.cache_dir.exists():
+            return 0
+
+        if self.backend == "sqlite":
+            cursor = self._get_db().execute("DELETE FROM cache")
+            return cursor.rowcount
+
+        # os.scandir lists the directory in one pass without building a
+        # Path object (plus extra stat probes) per entry like glob does.
+        with os.scandir(self.cache_dir) as entries:
+            cache_files = [
+                e.path for e in entries if e.name.endswith((".json", ".json.zst"))
+            ]
+        if not cache_files:
+            return 0
+
+        # Unlinks are independent syscalls that release the GIL; overlapping
+        # them helps a lot on slow or networked filesystems.
+        with ThreadPoolExecutor(max_workers=min(16, len(cache_files))) as executor:
+            for _ in executor.map(self._unlink_quiet, cache_files):
+                pass
+        return len(cache_files)
+
+    @staticmethod
+    def _unlink_quiet(path: str) -> None:
+        """Unlink a file, ignoring races where it is already gone."""
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 # Convenience functions for backwards compatibility
-_cache_manager: Optional[CacheManager] = None
+_cache_managers: dict[bool, CacheManager] = {}
 
 
-def _get_cache_manager() -> CacheManager:
+def _get_cache_manager(verify: bool = False) -> CacheManager:
     """Get or create global cache manager instance."""
-    global _cache_manager
-    if _cache_manager is None:
-        _cache_manager = CacheManager()
-    return _cache_manager
+    manager = _cache_managers.get(verify)
+    if manager is None:
+        manager = _cache_managers[verify] = CacheManager(verify_hash=verify)
+    return manager
 
 
-def get_cached_extraction(file_path: Path) -> Optional[dict]:
+def get_cached_extraction(file_path: Path, verify: bool = False) -> Optional[dict]:
     """Get cached extraction for a file."""
-    return _get_cache_manager().get(file_path)
+    return _get_cache_manager(verify).get(file_path)
 
 
-def save_extraction(file_path: Path, extraction: dict) -> None:
+def save_extraction(file_path: Path, extraction: dict, verify: bool = False) -> None:
     """Save extraction to cache."""
-    _get_cache_manager().save(file_path, extraction)
+    _get_cache_manager(verify).save(file_path, extraction)
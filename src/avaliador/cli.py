@@ -7,20 +7,28 @@ Provides the main CLI commands for evaluating MIT documents.
 import json
 import logging
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from avaliador import __version__
 from avaliador.cache.manager import CacheManager, get_cached_extraction, save_extraction
 from avaliador.config import settings
-from avaliador.evaluators.mit041 import MIT041Evaluator
-from avaliador.ingestors.docling_extractor import DoclingExtractor
-from avaliador.models.schemas import EvaluationResult
+
+if TYPE_CHECKING:
+    from avaliador.models.schemas import EvaluationResult
+
+# NOTE: the evaluator and extractor stacks (docling, openai) are imported
+# lazily inside `avaliar` so that fast commands (versao, config,
+# limpar_cache) do not pay seconds of import time.
 
 # Initialize CLI app
 app = typer.Typer(
@@ -39,8 +47,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _print_result_console(result: EvaluationResult, filename: str) -> None:
+def _preload_extractor() -> None:
+    """Import the docling stack; errors are reported later on actual use."""
+    try:
+        import avaliador.ingestors.docling_extractor  # noqa: F401
+    except Exception:
+        pass
+
+
+def _to_json(data: dict) -> str:
+    """Serialize a dict to pretty-printed JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _print_result_console(result: "EvaluationResult", filename: str) -> None:
     """Format and print result to console."""
+    from rich.panel import Panel
+
     # Determine color and status
     if result.score >= 8.0:
         color = "green"
@@ -115,6 +140,11 @@ def avaliar(
         "--no-vision",
         help="Desabilitar analise de imagens/diagramas",
     ),
+    verify: bool = typer.Option(
+        False,
+        "--verify",
+        help="Usar hash de conteudo (mais lento) em vez de tamanho+mtime na chave do cache",
+    ),
     include_metadata: bool = typer.Option(
         False,
         "--metadata",
@@ -146,10 +176,16 @@ def avaliar(
         )
         raise typer.Exit(1)
 
+    # Start importing the heavy docling stack in the background so the
+    # import overlaps with the cache lookup (stat/hash releases the GIL).
+    # On a cache hit the daemon thread is simply abandoned.
+    extractor_import = threading.Thread(target=_preload_extractor, daemon=True)
+    extractor_import.start()
+
     # Check cache
     extraction_dict = None
     if not no_cache:
-        extraction_dict = get_cached_extraction(arquivo)
+        extraction_dict = get_cached_extraction(arquivo, verify=verify)
         if extraction_dict:
             if not output_json:
                 console.print("[dim]Usando extracao em cache...[/dim]")
@@ -160,9 +196,12 @@ def avaliar(
             console.print("[dim]Extraindo documento...[/dim]")
 
         try:
+            extractor_import.join()
+            from avaliador.ingestors.docling_extractor import DoclingExtractor
+
             extractor = DoclingExtractor(enable_vision=not no_vision)
             extraction_dict = extractor.extract_to_dict(arquivo)
-            save_extraction(arquivo, extraction_dict)
+            save_extraction(arquivo, extraction_dict, verify=verify)
         except ImportError as e:
             console.print(
                 f"[red]Erro: Docling nao instalado.[/red]\n"
@@ -190,6 +229,8 @@ def avaliar(
         # Select evaluator based on type
         tipo_upper = tipo.upper()
         if tipo_upper in ["MIT041", "41"]:
+            from avaliador.evaluators.mit041 import MIT041Evaluator
+
             evaluator = MIT041Evaluator()
         else:
             console.print(
@@ -207,9 +248,9 @@ def avaliar(
     # Output result
     if output_json:
         if include_metadata:
-            print(json.dumps(result.model_dump(mode="json"), ensure_ascii=False, indent=2))
+            print(_to_json(result.model_dump(mode="json")))
         else:
-            print(json.dumps(result.to_simple_dict(), ensure_ascii=False, indent=2))
+            print(_to_json(result.to_simple_dict()))
     else:
         _print_result_console(result, arquivo.name)
 
@@ -225,6 +266,8 @@ def limpar_cache() -> None:
 @app.command()
 def config() -> None:
     """Mostra a configuracao atual."""
+    from rich.table import Table
+
     table = Table(title="Configuracao do Avaliador")
     table.add_column("Configuracao", style="cyan")
     table.add_column("Valor", style="green")
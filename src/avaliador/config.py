@@ -4,8 +4,9 @@ Configuration management for Avaliador de MITs.
 Uses pydantic-settings to load configuration from environment variables and .env files.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -46,6 +47,14 @@ class Settings(BaseSettings):
         default=Path.home() / ".cache" / "avaliador",
         description="Directory for cache storage",
     )
+    cache_pretty_json: bool = Field(
+        default=False,
+        description="Pretty-print cached JSON (debug only; doubles size and CPU)",
+    )
+    cache_backend: str = Field(
+        default="file",
+        description="Cache storage backend: 'file' (one JSON per entry) or 'sqlite'",
+    )
 
     # Logging Configuration
     log_level: str = Field(
@@ -58,6 +67,20 @@ class Settings(BaseSettings):
         default=True,
         description="Enable vision analysis for diagrams",
     )
+    vlm_concurrency: int = Field(
+        default=8,
+        description="Maximum concurrent VLM image-description requests",
+    )
+
+    # LLM Call Configuration
+    llm_max_tokens: int = Field(
+        default=4000,
+        description="Maximum tokens in LLM evaluation responses",
+    )
+    llm_json_mode: bool = Field(
+        default=True,
+        description="Request JSON-mode responses from the LLM",
+    )
 
     # Timeout Configuration
     llm_timeout: int = Field(
@@ -77,6 +100,15 @@ class Settings(BaseSettings):
             return Path(v).expanduser()
         return v.expanduser()
 
+    @field_validator("cache_backend", mode="before")
+    @classmethod
+    def normalize_cache_backend(cls, v: str) -> str:
+        """Normalize and validate the cache backend name."""
+        backend = v.lower() if isinstance(v, str) else v
+        if backend not in ("file", "sqlite"):
+            raise ValueError(f"Unknown cache backend: {v!r} (expected 'file' or 'sqlite')")
+        return backend
+
     @field_validator("log_level", mode="before")
     @classmethod
     def uppercase_log_level(cls, v: str) -> str:
@@ -94,5 +126,20 @@ class Settings(BaseSettings):
         return self.cache_dir
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the global settings instance, building it on first use.
+
+    Instantiating Settings parses environment variables and the .env file
+    through pydantic; caching the instance means that cost is paid once,
+    and only by code paths that actually read configuration.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily expose the `settings` singleton (PEP 562)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
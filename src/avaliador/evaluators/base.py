@@ -23,12 +23,21 @@ class BaseEvaluator(ABC):
     and implement the evaluate method.
     """
 
+    # No instance state of its own; empty slots keep subclasses free to
+    # declare __slots__ without inheriting a __dict__.
+    __slots__ = ()
+
     # MIT type this evaluator handles
     mit_type: MITType
 
     # Minimum score for approval
     min_passing_score: float = 8.0
 
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Pre-bind the approval threshold as a plain float on each subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._min_passing_score_f = float(cls.min_passing_score)
+
     @abstractmethod
     def evaluate(
         self,
@@ -94,4 +103,4 @@ class BaseEvaluator(ABC):
         Returns:
             True if score meets minimum passing score.
         """
-        return result.score >= self.min_passing_score
+        return result.score >= self._min_passing_score_f
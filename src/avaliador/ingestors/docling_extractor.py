@@ -7,8 +7,14 @@ Ensures full document extraction without any content limits.
 
 import io
 import logging
+import operator
+import queue
+import re
 import sys
-from datetime import datetime
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
@@ -25,6 +31,103 @@ logger = logging.getLogger(__name__)
 # Maximum size constant - ensures no artificial limits on extraction
 MAX_SIZE = sys.maxsize
 
+# Images per multi-image VLM request; beyond a handful the response starts
+# hitting token limits before every table is fully transcribed.
+VLM_BATCH_SIZE = 4
+
+# Completion cap for one multi-image request. The 4000-per-image scaling is
+# clamped here so a full batch never asks for more completion tokens than
+# the proxied models accept in a single response.
+VLM_BATCH_MAX_TOKENS = 12000
+
+# Longest image side sent to the VLM; most models resize to ~1568px
+# internally, so shipping more pixels only inflates the upload.
+VLM_MAX_SIDE = 1568
+
+# One case-insensitive scan over the description instead of lower() plus up
+# to seven substring searches; group order encodes keyword precedence.
+_DIAGRAM_TYPE_RE = re.compile(
+    r"(bpmn)|(swimlane|raia)|(fluxo|flowchart)|(processo|process)",
+    re.IGNORECASE,
+)
+_DIAGRAM_TYPES = ("BPMN", "Swimlane", "Flowchart", "Process Diagram")
+
+# Resolved in C in one go; the failure cases fall through to AttributeError
+# instead of paying hasattr checks per link of the chain.
+_get_desc_text = operator.attrgetter("meta.description.text")
+_get_desc = operator.attrgetter("meta.description")
+
+_WS_RE = re.compile(r"\S+")
+
+# Marks the end of the conversion stream in extract_many's hand-off queue.
+_QUEUE_SENTINEL = object()
+
+
+def _count_words(s: str) -> int:
+    """Count whitespace-separated words without materializing them.
+
+    str.split() would allocate one string per word plus the list — a few MB
+    of garbage for a long document when only the count is needed.
+    """
+    return sum(1 for _ in _WS_RE.finditer(s))
+
+
+# The effective converter configuration, spelled out as the cache key.
+# Extractor state such as enable_vision does not influence the converter, so
+# keying by the options signature makes the sharing invariant explicit:
+# equal options -> same converter instance (within a thread).
+_DOCX_OPTIONS_KEY = (("docx", "SimplePipeline"),)
+_converter_tls = threading.local()
+
+
+def _get_shared_converter():
+    """
+    Build the Docling converter once per thread and options signature.
+
+    DocumentConverter construction loads pipeline metadata and is by far the
+    most expensive part of extractor setup; the configuration below does not
+    vary between extractor instances, so one converter (and its internal
+    per-format pipeline cache) serves every extractor on a thread. The
+    sharing stops at thread boundaries: the converter's pipeline cache is
+    not lock-protected, so concurrent extraction threads each get their own.
+    """
+    cache: dict[tuple, Any] = getattr(_converter_tls, "cache", None) or {}
+    _converter_tls.cache = cache
+    converter = cache.get(_DOCX_OPTIONS_KEY)
+    if converter is not None:
+        return converter
+    try:
+        from docling.datamodel.base_models import InputFormat
+        from docling.document_converter import (
+            DocumentConverter,
+            WordFormatOption,
+        )
+        from docling.pipeline.simple_pipeline import SimplePipeline
+
+        # Configure DOCX extraction with SimplePipeline for full content
+        # SimplePipeline provides direct document parsing without limits
+        format_options = {
+            InputFormat.DOCX: WordFormatOption(
+                pipeline_cls=SimplePipeline,
+            ),
+        }
+
+        # Create converter with explicit format options
+        # allowed_formats ensures only supported formats are processed
+        converter = DocumentConverter(
+            allowed_formats=[InputFormat.DOCX],
+            format_options=format_options,
+        )
+
+        logger.debug("Docling converter initialized with SimplePipeline for DOCX")
+        cache[_DOCX_OPTIONS_KEY] = converter
+        return converter
+
+    except ImportError as e:
+        raise ImportError(
+            "Docling is not installed. Install with: pip install docling"
+        ) from e
+
 
 class DoclingExtractor:
     """
@@ -52,6 +155,7 @@ class DoclingExtractor:
         self._converter = None
         self._llm_client = llm_client
         self._bpmn_prompt: Optional[str] = None
+        self._extract_memo: dict[tuple[str, int, int], ExtractionResult] = {}
 
     @property
     def llm_client(self) -> Any:
@@ -90,41 +194,11 @@ class DoclingExtractor:
         Lazy-load Docling converter configured for full document extraction.
 
         Uses SimplePipeline for DOCX files which provides direct parsing
-        without artificial content limits.
+        without artificial content limits. The converter itself is shared
+        per thread (see _get_shared_converter).
         """
         if self._converter is None:
-            try:
-                from docling.datamodel.base_models import InputFormat
-                from docling.document_converter import (
-                    DocumentConverter,
-                    WordFormatOption,
-                )
-                from docling.pipeline.simple_pipeline import SimplePipeline
-
-                # Configure DOCX extraction with SimplePipeline for full content
-                # SimplePipeline provides direct document parsing without limits
-                format_options = {
-                    InputFormat.DOCX: WordFormatOption(
-                        pipeline_cls=SimplePipeline,
-                    ),
-                }
-
-                # Create converter with explicit format options
-                # allowed_formats ensures only supported formats are processed
-                self._converter = DocumentConverter(
-                    allowed_formats=[InputFormat.DOCX],
-                    format_options=format_options,
-                )
-
-                logger.debug(
-                    "Docling converter initialized with SimplePipeline for DOCX"
-                )
-
-            except ImportError as e:
-                raise ImportError(
-                    "Docling is not installed. Install with: pip install docling"
-                ) from e
-
+            self._converter = _get_shared_converter()
         return self._converter
 
     def extract(self, file_path: Path) -> ExtractionResult:
@@ -144,29 +218,141 @@ class DoclingExtractor:
             FileNotFoundError: If file does not exist.
             ValueError: If file format is not supported.
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # Memoize per (path, mtime, size): a repeat call for an unchanged
+        # file costs one stat instead of a full Docling parse plus VLM calls.
+        if file_path.exists():
+            st = file_path.stat()
+            memo_key = (str(file_path), st.st_mtime_ns, st.st_size)
+            cached = self._extract_memo.get(memo_key)
+            if cached is not None:
+                return cached
+        else:
+            memo_key = None
 
-        # Validate file extension
-        if file_path.suffix.lower() not in [".docx", ".doc"]:
-            raise ValueError(
-                f"Unsupported file format: {file_path.suffix}. Only .docx files are supported."
-            )
+        result = next(self.extract_many([file_path]), None)
+        if result is None:
+            raise ValueError(f"Failed to convert document: {file_path}")
+
+        if memo_key is not None:
+            if len(self._extract_memo) >= 64:
+                # Drop the oldest entry; insertion order doubles as age.
+                self._extract_memo.pop(next(iter(self._extract_memo)))
+            self._extract_memo[memo_key] = result
+        return result
+
+    def extract_many(self, paths: Sequence[Path]) -> Iterator[ExtractionResult]:
+        """
+        Extract content from several documents through one converter pass.
+
+        convert_all keeps the per-format pipeline warm across documents and
+        lets Docling overlap IO with parsing, so a batch finishes well ahead
+        of N sequential convert() calls. Results are yielded in input order
+        as they complete; documents that fail to convert are logged and
+        skipped rather than aborting the batch.
+
+        Args:
+            paths: Paths to the document files.
+
+        Yields:
+            ExtractionResult for each successfully converted document.
+
+        Raises:
+            FileNotFoundError: If any file does not exist.
+            ValueError: If any file format is not supported.
+        """
+        for file_path in paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+            # Validate file extension
+            if file_path.suffix.lower() not in [".docx", ".doc"]:
+                raise ValueError(
+                    f"Unsupported file format: {file_path.suffix}. "
+                    "Only .docx files are supported."
+                )
+
+        from docling.datamodel.base_models import ConversionStatus
 
         converter = self._get_converter()
 
-        logger.info(f"Starting extraction of: {file_path.name}")
+        logger.info(f"Starting extraction of {len(paths)} document(s)")
+
+        # One timestamp for the whole batch: the clock read and datetime
+        # construction (plus its pydantic re-validation) happen once instead
+        # of once per file.
+        batch_timestamp = datetime.now(timezone.utc)
 
-        # Convert document with explicit parameters to ensure full extraction
+        # Convert documents with explicit parameters to ensure full extraction
         # max_num_pages=MAX_SIZE ensures no page limit
         # max_file_size=MAX_SIZE ensures no file size limit
-        result = converter.convert(
-            str(file_path),
+        results = converter.convert_all(
+            [str(p) for p in paths],
+            raises_on_error=False,
             max_num_pages=MAX_SIZE,
             max_file_size=MAX_SIZE,
         )
-        doc = result.document
 
+        # convert_all is itself a lazy iterator, so draining it on a
+        # background thread lets Docling parse document i+1 while the main
+        # thread runs the markdown/filter/VLM pipeline on document i. The
+        # small queue bound keeps at most two parsed documents in memory.
+        conversion_queue: queue.Queue = queue.Queue(maxsize=2)
+        abandoned = threading.Event()
+
+        def _put(item: Any) -> bool:
+            # Bounded put that gives up once the consumer is gone; without
+            # the flag, an abandoned generator would leave the producer
+            # blocked forever on the full queue.
+            while not abandoned.is_set():
+                try:
+                    conversion_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _produce() -> None:
+            try:
+                for conversion in results:
+                    if not _put(conversion):
+                        return
+            except Exception as e:
+                if not _put(e):
+                    return
+            _put(_QUEUE_SENTINEL)
+
+        producer = threading.Thread(
+            target=_produce, name="docling-convert", daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                item = conversion_queue.get()
+                if item is _QUEUE_SENTINEL:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if item.status != ConversionStatus.SUCCESS:
+                    logger.warning(
+                        f"Conversion failed for {item.input.file}: {item.status}"
+                    )
+                    continue
+                yield self._build_extraction(item.document, batch_timestamp)
+        finally:
+            # Runs on normal exhaustion and on early break/close() alike:
+            # wave the producer off, drain anything it already queued so an
+            # in-flight put unblocks, and reap the thread.
+            abandoned.set()
+            while True:
+                try:
+                    conversion_queue.get_nowait()
+                except queue.Empty:
+                    break
+            producer.join()
+
+    def _build_extraction(self, doc: Any, timestamp: datetime) -> ExtractionResult:
+        """Run the markdown/picture/diagram pipeline on a converted document."""
         # Export to markdown with explicit parameters for full content
         # from_element=0 starts from beginning
         # to_element=MAX_SIZE ensures all elements are included (no truncation)
@@ -175,14 +361,14 @@ class DoclingExtractor:
             to_element=MAX_SIZE,
         )
 
+        # Count words (once; the log message reuses the figure)
+        word_count = _count_words(markdown)
+
         logger.info(
             f"Extraction complete: {len(markdown)} characters, "
-            f"approximately {len(markdown.split())} words"
+            f"approximately {word_count} words"
         )
 
-        # Count words
-        word_count = len(markdown.split())
-
         # Get pictures and filter relevant ones
         all_pictures = list(doc.pictures) if hasattr(doc, "pictures") else []
         relevant_pictures = self.image_filter.filter_pictures(all_pictures)
@@ -190,21 +376,46 @@ class DoclingExtractor:
         # Extract diagram descriptions
         diagrams: list[DiagramDescription] = []
         if self.enable_vision:
+            descriptions: list[str] = []
+            vlm_indices: list[int] = []
             for i, pic in enumerate(relevant_pictures):
-                # Check for existing description from Docling
-                description = ""
-                if hasattr(pic, "meta") and pic.meta:
-                    if hasattr(pic.meta, "description") and pic.meta.description:
-                        description = (
-                            pic.meta.description.text
-                            if hasattr(pic.meta.description, "text")
-                            else str(pic.meta.description)
-                        )
-
-                # If no Docling description, try VLM analysis
+                # Check for existing description from Docling (EAFP: missing
+                # links in the chain are the common case, not an error)
+                try:
+                    description = _get_desc_text(pic) or ""
+                except AttributeError:
+                    try:
+                        desc = _get_desc(pic)
+                        description = str(desc) if desc else ""
+                    except AttributeError:
+                        description = ""
+
+                descriptions.append(description)
+                # If no Docling description, queue the image for VLM analysis
                 if not description and self.llm_client is not None:
-                    description = self._describe_image_with_vlm(pic, i)
+                    vlm_indices.append(i)
+
+            if vlm_indices:
+                # Group images into multi-image requests (amortizing the HTTP
+                # round-trip across VLM_BATCH_SIZE images) and run the batches
+                # on a bounded pool so they still overlap on the network.
+                batches = [
+                    vlm_indices[j : j + VLM_BATCH_SIZE]
+                    for j in range(0, len(vlm_indices), VLM_BATCH_SIZE)
+                ]
+                max_workers = min(settings.vlm_concurrency, len(batches))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    batch_results = executor.map(
+                        lambda batch: self._describe_batch_with_vlm(
+                            relevant_pictures, batch
+                        ),
+                        batches,
+                    )
+                    for batch, batch_descriptions in zip(batches, batch_results):
+                        for i, description in zip(batch, batch_descriptions):
+                            descriptions[i] = description
 
+            for i, description in enumerate(descriptions):
                 if description:
                     diagrams.append(
                         DiagramDescription(
@@ -220,7 +431,7 @@ class DoclingExtractor:
             image_count=len(all_pictures),
             relevant_images=len(relevant_pictures),
             vision_enabled=self.enable_vision and len(diagrams) > 0,
-            extraction_timestamp=datetime.now(),
+            extraction_timestamp=timestamp,
         )
 
         return ExtractionResult(
@@ -241,24 +452,8 @@ class DoclingExtractor:
             Description of the image or empty string if failed.
         """
         try:
-            # Get image data
-            if not hasattr(pic, "image") or pic.image is None:
-                return ""
-
-            # Convert PIL Image to bytes
-            image = pic.image
-            if hasattr(image, "pil_image"):
-                image = image.pil_image
-
-            # Convert to PNG bytes
-            img_buffer = io.BytesIO()
-            if hasattr(image, "save"):
-                image.save(img_buffer, format="PNG")
-                img_data = img_buffer.getvalue()
-            elif hasattr(image, "tobytes"):
-                img_data = image.tobytes()
-            else:
-                logger.warning(f"Cannot extract image data for diagram {index}")
+            img_data = self._extract_image_bytes(pic, index)
+            if not img_data:
                 return ""
 
             # Call VLM with sufficient tokens for detailed content extraction
@@ -276,6 +471,102 @@ class DoclingExtractor:
             logger.warning(f"VLM analysis failed for diagram {index}: {e}")
             return ""
 
+    def _describe_batch_with_vlm(self, pictures: list[Any], indices: list[int]) -> list[str]:
+        """
+        Describe a batch of pictures through one multi-image VLM request.
+
+        Pictures whose raster data cannot be extracted come back as empty
+        strings; the rest go to the proxy in a single call, with the client
+        falling back to per-image requests when marker parsing fails. A
+        failed batch request (oversized payload, model rejecting multi-image
+        content) likewise degrades to individual requests instead of losing
+        every description in the batch.
+
+        Args:
+            pictures: Full list of relevant pictures.
+            indices: Positions within pictures to describe.
+
+        Returns:
+            Descriptions aligned with indices (empty string on failure).
+        """
+        results = [""] * len(indices)
+        image_datas: list[bytes] = []
+        positions: list[int] = []
+        for pos, i in enumerate(indices):
+            img_data = self._extract_image_bytes(pictures[i], i)
+            if img_data:
+                image_datas.append(img_data)
+                positions.append(pos)
+
+        if not image_datas:
+            return results
+
+        logger.info(f"Analyzing {len(image_datas)} image(s) with VLM...")
+        try:
+            batch_descriptions = self.llm_client.describe_images(
+                image_datas=image_datas,
+                prompt=self._get_image_analysis_prompt(),
+                mime_type="image/png",
+                # High limit for full table transcription, scaled per image
+                # but clamped to what one response may carry
+                max_tokens=min(4000 * len(image_datas), VLM_BATCH_MAX_TOKENS),
+            )
+        except Exception as e:
+            logger.warning(
+                f"VLM batch analysis failed for diagrams {indices}: {e}; "
+                "retrying images individually"
+            )
+            for pos in positions:
+                i = indices[pos]
+                results[pos] = self._describe_image_with_vlm(pictures[i], i)
+            return results
+
+        for pos, description in zip(positions, batch_descriptions):
+            results[pos] = description.strip()
+        return results
+
+    def _extract_image_bytes(self, pic: Any, index: int) -> bytes:
+        """Pull PNG-encoded raster bytes out of a Docling picture item."""
+        try:
+            if not hasattr(pic, "image") or pic.image is None:
+                return b""
+
+            # Convert PIL Image to bytes
+            image = pic.image
+            if hasattr(image, "pil_image"):
+                image = image.pil_image
+
+            # Convert to PNG bytes
+            if hasattr(image, "save"):
+                return self._image_to_png(image)
+            if hasattr(image, "tobytes"):
+                return image.tobytes()
+
+            logger.warning(f"Cannot extract image data for diagram {index}")
+            return b""
+        except Exception as e:
+            logger.warning(f"Image extraction failed for diagram {index}: {e}")
+            return b""
+
+    @staticmethod
+    def _image_to_png(image: Any) -> bytes:
+        """
+        Encode a PIL image as PNG bytes.
+
+        Oversized images are downscaled to VLM_MAX_SIDE first, and the
+        encoder runs at compress_level=1 with optimize off: the bytes go
+        straight to the VLM, so spending deflate effort on maximum
+        compression buys nothing.
+        """
+        size = getattr(image, "size", None)
+        if size and max(size) > VLM_MAX_SIDE and hasattr(image, "thumbnail"):
+            image = image.copy()
+            image.thumbnail((VLM_MAX_SIDE, VLM_MAX_SIDE))
+
+        img_buffer = io.BytesIO()
+        image.save(img_buffer, format="PNG", optimize=False, compress_level=1)
+        return img_buffer.getvalue()
+
     def _detect_diagram_type(self, description: str) -> Optional[str]:
         """
         Detect diagram type from description.
@@ -286,18 +577,17 @@ class DoclingExtractor:
         Returns:
             Detected diagram type or None.
         """
-        description_lower = description.lower()
-
-        if "bpmn" in description_lower:
-            return "BPMN"
-        elif "swimlane" in description_lower or "raia" in description_lower:
-            return "Swimlane"
-        elif "fluxo" in description_lower or "flowchart" in description_lower:
-            return "Flowchart"
-        elif "processo" in description_lower or "process" in description_lower:
-            return "Process Diagram"
-        else:
-            return None
+        # Keep the original precedence (BPMN > Swimlane > Flowchart >
+        # Process) rather than first-position-wins: track the best group
+        # seen and bail out early once the top keyword appears.
+        best = None
+        for match in _DIAGRAM_TYPE_RE.finditer(description):
+            index = match.lastindex
+            if index == 1:
+                return _DIAGRAM_TYPES[0]
+            if best is None or index < best:
+                best = index
+        return _DIAGRAM_TYPES[best - 1] if best is not None else None
 
     def extract_to_dict(self, file_path: Path) -> dict:
         """
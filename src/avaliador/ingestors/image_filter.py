@@ -7,6 +7,11 @@ Filters out logos, headers, icons and keeps only meaningful diagrams.
 from dataclasses import dataclass
 from typing import Any, Protocol
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 
 # Minimum dimensions for a diagram (in pixels)
 MIN_WIDTH = 200
@@ -27,7 +32,7 @@ class PictureItemProtocol(Protocol):
     def image(self) -> Any: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageAnalysis:
     """Result of image analysis for filtering."""
 
@@ -148,6 +153,22 @@ class ImageFilter:
             aspect_ratio=aspect_ratio,
         )
 
+    def _is_relevant_fast(self, width: int, height: int) -> bool:
+        """
+        Allocation-free relevance check for the filtering hot path.
+
+        Mirrors analyze() but skips the ImageAnalysis construction and
+        reason formatting; the ratio bounds are rewritten as
+        min_ar * h <= w <= max_ar * h to avoid the float division.
+        """
+        return (
+            width >= self.min_width
+            and height >= self.min_height
+            and width * height >= self.min_area
+            and height > 0
+            and self.min_aspect_ratio * height <= width <= self.max_aspect_ratio * height
+        )
+
     def filter_pictures(self, pictures: list[Any]) -> list[Any]:
         """
         Filter a list of Docling PictureItem objects.
@@ -158,35 +179,65 @@ class ImageFilter:
         Returns:
             Filtered list containing only relevant diagrams.
         """
-        relevant = []
+        # Single pass to gather candidates and their dimensions
+        candidates: list[Any] = []
+        widths: list[int] = []
+        heights: list[int] = []
 
         for pic in pictures:
             # Skip if no image data
             if not hasattr(pic, "image") or pic.image is None:
                 continue
 
-            # Get dimensions
+            # Prefer the declared size from provenance metadata: it comes
+            # straight from the DOCX XML, so icons and logos destined to be
+            # filtered out never force PIL to decode their raster data.
             try:
-                if hasattr(pic.image, "size"):
+                bbox = pic.prov[0].bbox
+                width = int(bbox.width)
+                height = int(bbox.height)
+                if width <= 0 or height <= 0:
+                    raise ValueError
+            except (AttributeError, IndexError, TypeError, ValueError):
+                # Fall back to the actual image (EAFP: attribute-style size
+                # first, tuple second)
+                try:
                     size = pic.image.size
-                    if hasattr(size, "width") and hasattr(size, "height"):
-                        width = size.width
-                        height = size.height
-                    elif isinstance(size, tuple) and len(size) >= 2:
+                except AttributeError:
+                    continue
+                try:
+                    width = size.width
+                    height = size.height
+                except AttributeError:
+                    try:
                         width, height = size[0], size[1]
-                    else:
+                    except (TypeError, IndexError):
                         continue
-                else:
-                    continue
-            except (AttributeError, TypeError):
-                continue
 
-            # Analyze and filter
-            analysis = self.analyze(width, height)
-            if analysis.is_relevant:
-                relevant.append(pic)
+            candidates.append(pic)
+            widths.append(width)
+            heights.append(height)
+
+        if np is not None and candidates:
+            # All threshold comparisons run as C array ops; only the final
+            # gather touches Python objects.
+            w = np.asarray(widths, dtype=np.int64)
+            h = np.asarray(heights, dtype=np.int64)
+            ratios = np.where(h > 0, w / np.maximum(h, 1), 0.0)
+            mask = (
+                (w >= self.min_width)
+                & (h >= self.min_height)
+                & (w * h >= self.min_area)
+                & (ratios >= self.min_aspect_ratio)
+                & (ratios <= self.max_aspect_ratio)
+            )
+            return [candidates[i] for i in np.flatnonzero(mask)]
 
-        return relevant
+        return [
+            pic
+            for pic, width, height in zip(candidates, widths, heights)
+            if self._is_relevant_fast(width, height)
+        ]
 
 
 # Convenience function
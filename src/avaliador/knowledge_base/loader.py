@@ -9,11 +9,69 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    # Optional: orjson parses UTF-8 bytes directly in C, skipping the
+    # read_text() decode pass. Part of the 'perf' extra.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, stdlib json otherwise."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 # Base directory for knowledge base files
 KB_DIR = Path(__file__).parent
 
+# Strips separators in one translate() call instead of chained replace()
+_STRIP_TABLE = str.maketrans("", "", "-_")
+
+_MIT_FILENAMES = {
+    "MIT041": "mit041.json",
+    "MIT043": "mit043.json",
+    "MIT037": "mit037.json",
+    "MIT045": "mit045.json",
+    "MIT065": "mit065.json",
+}
+# Accept both "MIT041" and bare "041" spellings with a single dict lookup
+_FILENAME_MAP = {
+    key: filename
+    for mit, filename in _MIT_FILENAMES.items()
+    for key in (mit, mit[3:])
+}
+
+# The whole knowledge base is well under 1MB, so it is pinned into memory at
+# import; warm lookups become plain dict hits with no exists() syscall or
+# lru_cache hashing. Unknown names still fall back to the disk path.
+_PRELOADED_CRITERIA: dict[str, dict[str, Any]] = {}
+_PRELOADED_PROMPTS: dict[str, str] = {}
+
+_PROMPTS_DIR = KB_DIR / "prompts"
+
+
+def _preload_knowledge_base() -> None:
+    """(Re)read every criteria and prompt file into the preload dicts."""
+    _PRELOADED_CRITERIA.clear()
+    for filename in _MIT_FILENAMES.values():
+        path = KB_DIR / filename
+        if path.exists():
+            try:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+                # one except clause covers both parsers.
+                _PRELOADED_CRITERIA[filename] = _json_loads(path.read_bytes())
+            except json.JSONDecodeError:
+                pass
+
+    _PRELOADED_PROMPTS.clear()
+    if _PROMPTS_DIR.exists():
+        for path in _PROMPTS_DIR.glob("*.txt"):
+            _PRELOADED_PROMPTS[path.stem] = path.read_text(encoding="utf-8")
+
+
+_preload_knowledge_base()
+
 
-@lru_cache(maxsize=10)
 def load_criteria(mit_type: str) -> dict[str, Any]:
     """
     Load evaluation criteria for a specific MIT type.
@@ -28,35 +86,32 @@ def load_criteria(mit_type: str) -> dict[str, Any]:
         FileNotFoundError: If criteria file does not exist.
         ValueError: If criteria file is invalid JSON.
     """
-    # Normalize MIT type
-    mit_type = mit_type.upper().replace("-", "").replace("_", "")
-    if not mit_type.startswith("MIT"):
-        mit_type = f"MIT{mit_type}"
-
-    # Map to filename
-    filename_map = {
-        "MIT041": "mit041.json",
-        "MIT043": "mit043.json",
-        "MIT037": "mit037.json",
-        "MIT045": "mit045.json",
-        "MIT065": "mit065.json",
-    }
-
-    filename = filename_map.get(mit_type)
+    # Normalize MIT type and map to filename in one lookup; the cached
+    # helper only ever sees canonical filenames, so "MIT041", "mit041" and
+    # "041" all share a single cache entry.
+    filename = _FILENAME_MAP.get(mit_type.upper().translate(_STRIP_TABLE))
     if not filename:
         raise ValueError(f"Unknown MIT type: {mit_type}")
+    return _load_criteria_cached(filename)
+
+
+@lru_cache(maxsize=64)
+def _load_criteria_cached(filename: str) -> dict[str, Any]:
+    """Return criteria for a canonical filename, reading disk at most once."""
+    preloaded = _PRELOADED_CRITERIA.get(filename)
+    if preloaded is not None:
+        return preloaded
 
     criteria_path = KB_DIR / filename
     if not criteria_path.exists():
-        raise FileNotFoundError(f"Criteria file not found for {mit_type}: {criteria_path}")
+        raise FileNotFoundError(f"Criteria file not found: {criteria_path}")
 
     try:
-        return json.loads(criteria_path.read_text(encoding="utf-8"))
+        return _json_loads(criteria_path.read_bytes())
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in criteria file {criteria_path}: {e}") from e
 
 
-@lru_cache(maxsize=20)
 def get_prompt(prompt_name: str) -> str:
     """
     Load a prompt template from the prompts directory.
@@ -70,6 +125,17 @@ def get_prompt(prompt_name: str) -> str:
     Raises:
         FileNotFoundError: If prompt file does not exist.
     """
+    # Strip any .txt suffix before caching so both spellings share an entry
+    return _load_prompt_cached(prompt_name.removesuffix(".txt"))
+
+
+@lru_cache(maxsize=64)
+def _load_prompt_cached(prompt_name: str) -> str:
+    """Return a prompt by stem, reading disk at most once per name."""
+    preloaded = _PRELOADED_PROMPTS.get(prompt_name)
+    if preloaded is not None:
+        return preloaded
+
     prompts_dir = KB_DIR / "prompts"
 
     # Try with and without .txt extension
@@ -111,6 +177,12 @@ def get_available_prompts() -> list[str]:
 
 
 def clear_cache() -> None:
-    """Clear all cached criteria and prompts."""
-    load_criteria.cache_clear()
-    get_prompt.cache_clear()
+    """
+    Clear all cached criteria and prompts.
+
+    The import-time preload is rebuilt from disk as well, so long-lived
+    processes pick up edited criteria/prompt files on their next lookup.
+    """
+    _load_criteria_cached.cache_clear()
+    _load_prompt_cached.cache_clear()
+    _preload_knowledge_base()
@@ -1,5 +1,5 @@
 """LLM module for DTA Proxy integration."""
 
-from avaliador.llm.dta_client import DTAProxyClient
+from avaliador.llm.dta_client import DTAError, DTAProxyClient, LLMResponse
 
-__all__ = ["DTAProxyClient"]
+__all__ = ["DTAError", "DTAProxyClient", "LLMResponse"]
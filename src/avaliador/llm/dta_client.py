@@ -4,15 +4,141 @@ DTA Proxy client for LLM interactions.
 Provides a wrapper around the OpenAI SDK configured for DTA Proxy.
 """
 
+import asyncio
 import base64
+import hashlib
+import json
+import mmap
+import re
+import weakref
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI, OpenAIError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
 
 from avaliador.config import settings
 
 
+class DTAError(Exception):
+    """Raised when a DTA Proxy call fails."""
+
+
+def _build_http_client(async_: bool):
+    """
+    Build a pooled httpx client for the OpenAI SDK, or None for the default.
+
+    Keep-alive pooling amortizes the TCP/TLS handshake across requests;
+    HTTP/2 additionally multiplexes concurrent batch requests over one
+    connection, but needs the httpx[http2] extra, so it is attempted and
+    quietly dropped when h2 is not installed.
+    """
+    if httpx is None:
+        return None
+    cls = httpx.AsyncClient if async_ else httpx.Client
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    timeout = httpx.Timeout(settings.llm_timeout)
+    try:
+        return cls(http2=True, limits=limits, timeout=timeout)
+    except ImportError:
+        return cls(limits=limits, timeout=timeout)
+
+
+# Known image suffixes; anything else falls back to PNG
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+
+def _read_vision_cache(cache_path: Optional[Path]) -> Optional[str]:
+    """Return a cached vision description, or None on miss/corruption."""
+    if cache_path is None:
+        return None
+    try:
+        return json.loads(cache_path.read_bytes())["description"]
+    except (OSError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def _write_vision_cache(cache_path: Optional[Path], description: str) -> None:
+    """Persist a vision description; IO failures are non-fatal."""
+    if cache_path is None or not description:
+        return
+    try:
+        cache_path.write_text(
+            json.dumps({"description": description}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=128)
+def _encode_image(path: str, mtime_ns: int) -> tuple[str, str, str]:
+    """
+    Read, hash and base64-encode an image file, memoized per (path, mtime).
+
+    The file is memory-mapped once and both the SHA-256 (for the response
+    cache key) and the base64 payload read the same buffer, so a multi-MB
+    PNG is pulled through the page cache in a single pass instead of one
+    read for hashing and another for encoding.
+
+    Returns:
+        (mime_type, base64_str, sha256_hex).
+    """
+    image_path = Path(path)
+    mime_type = _MIME_TYPES.get(image_path.suffix.lower(), "image/png")
+    with open(image_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha256_hex = hashlib.sha256(mm).hexdigest()
+                image_base64 = base64.b64encode(mm).decode("utf-8")
+        except ValueError:
+            # Empty files cannot be mapped
+            data = f.read()
+            sha256_hex = hashlib.sha256(data).hexdigest()
+            image_base64 = base64.b64encode(data).decode("utf-8")
+    return mime_type, image_base64, sha256_hex
+
+
+# Marker used to address individual images in multi-image prompts and to
+# split the model's combined answer back into per-image descriptions.
+_IMG_MARKER_RE = re.compile(r"\[IMG (\d+)\]")
+
+# OpenAI clients shared across DTAProxyClient instances with the same
+# credentials, so per-evaluator DTAProxyClient() construction reuses one
+# connection pool instead of opening a fresh TLS session each.
+_sync_clients: dict[tuple[str, str], OpenAI] = {}
+
+# Async clients are additionally keyed by the running event loop: their
+# pooled keep-alive connections are bound to the loop they were opened on,
+# and reusing them after asyncio.run() closes that loop fails every request
+# of the next batch. The weak keying lets closed loops release their
+# clients instead of accumulating dead pools.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass(slots=True)
+class LLMResponse:
+    """Chat completion response with metadata needed by callers."""
+
+    content: str
+    finish_reason: Optional[str] = None
+
+
 class DTAProxyClient:
     """
     Client for interacting with DTA Proxy LLM service.
@@ -44,10 +170,231 @@ class DTAProxyClient:
                 "Set DTA_PROXY_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url,
+        pool_key = (self.api_key, self.base_url)
+        client = _sync_clients.get(pool_key)
+        if client is None:
+            client = _sync_clients.setdefault(
+                pool_key,
+                OpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    http_client=_build_http_client(async_=False),
+                ),
+            )
+        self.client = client
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """
+        Get or create the async client for the running event loop.
+
+        Shares credentials with the sync client. The client is cached per
+        (loop, credentials) rather than per instance: a client outliving
+        its loop — the natural outcome of back-to-back asyncio.run calls
+        such as repeated evaluate_batch/run_batch in one process — would
+        hand the next batch keep-alive connections tied to a closed loop.
+        """
+        loop = asyncio.get_running_loop()
+        loop_clients = _async_clients.get(loop)
+        if loop_clients is None:
+            loop_clients = _async_clients.setdefault(loop, {})
+        pool_key = (self.api_key, self.base_url)
+        aclient = loop_clients.get(pool_key)
+        if aclient is None:
+            aclient = loop_clients.setdefault(
+                pool_key,
+                AsyncOpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    http_client=_build_http_client(async_=True),
+                ),
+            )
+        return aclient
+
+    def _build_chat_kwargs(
+        self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: Optional[int],
+        json_mode: bool,
+    ) -> dict:
+        """Build the kwargs shared by sync and async chat completions."""
+        kwargs: dict = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout": timeout or settings.llm_timeout,
+        }
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+
+    def chat_completion_with_metadata(
+        self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        timeout: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """
+        Send a chat completion request and return content plus metadata.
+
+        Args:
+            system_prompt: System message content.
+            user_content: User message content.
+            temperature: Sampling temperature (0-2).
+            max_tokens: Maximum tokens in response.
+            timeout: Request timeout in seconds.
+            json_mode: Request a guaranteed-JSON response from the model.
+
+        Returns:
+            LLMResponse with content and finish_reason.
+
+        Raises:
+            DTAError: If the request to DTA Proxy fails.
+        """
+        kwargs = self._build_chat_kwargs(
+            system_prompt, user_content, temperature, max_tokens, timeout, json_mode
+        )
+        try:
+            response = self.client.chat.completions.create(**kwargs)
+        except OpenAIError as e:
+            raise DTAError(f"DTA Proxy request failed: {e}") from e
+
+        choice = response.choices[0]
+        return LLMResponse(
+            content=choice.message.content or "",
+            finish_reason=choice.finish_reason,
+        )
+
+    async def achat_completion_with_metadata(
+        self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        timeout: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """
+        Async variant of chat_completion_with_metadata.
+
+        Multiple awaits can run concurrently on the shared async client,
+        which is what makes batch evaluation network-bound instead of
+        latency-bound.
+        """
+        kwargs = self._build_chat_kwargs(
+            system_prompt, user_content, temperature, max_tokens, timeout, json_mode
+        )
+        try:
+            response = await self.aclient.chat.completions.create(**kwargs)
+        except OpenAIError as e:
+            raise DTAError(f"DTA Proxy request failed: {e}") from e
+
+        choice = response.choices[0]
+        return LLMResponse(
+            content=choice.message.content or "",
+            finish_reason=choice.finish_reason,
+        )
+
+    async def achat_completion_streaming(
+        self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        timeout: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """
+        Streaming variant of achat_completion_with_metadata.
+
+        Accumulates the streamed deltas and stops iterating as soon as a
+        finish_reason arrives, closing the stream immediately instead of
+        holding the connection until the server finishes. Truncated
+        (finish_reason == "length") responses are therefore detected without
+        waiting out the full response timeout.
+
+        Returns:
+            LLMResponse with the accumulated content and finish_reason.
+
+        Raises:
+            DTAError: If the request to DTA Proxy fails.
+        """
+        kwargs = self._build_chat_kwargs(
+            system_prompt, user_content, temperature, max_tokens, timeout, json_mode
         )
+        parts: list[str] = []
+        finish_reason: Optional[str] = None
+        try:
+            stream = await self.aclient.chat.completions.create(stream=True, **kwargs)
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.delta and choice.delta.content:
+                        parts.append(choice.delta.content)
+                    if choice.finish_reason is not None:
+                        finish_reason = choice.finish_reason
+                        break
+            finally:
+                await stream.close()
+        except OpenAIError as e:
+            raise DTAError(f"DTA Proxy request failed: {e}") from e
+
+        return LLMResponse(content="".join(parts), finish_reason=finish_reason)
+
+    def chat_completion_stream(
+        self,
+        system_prompt: str,
+        user_content: str,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        timeout: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion's content fragments as they arrive.
+
+        Callers can start parsing — or bail out — before the model finishes
+        generating; abandoning the iterator closes the underlying stream
+        instead of waiting out the remaining tokens. "".join(...) over the
+        iterator recovers the full response string.
+
+        Yields:
+            Content fragments in generation order.
+
+        Raises:
+            DTAError: If the request to DTA Proxy fails.
+        """
+        kwargs = self._build_chat_kwargs(
+            system_prompt, user_content, temperature, max_tokens, timeout, json_mode
+        )
+        try:
+            stream = self.client.chat.completions.create(stream=True, **kwargs)
+        except OpenAIError as e:
+            raise DTAError(f"DTA Proxy request failed: {e}") from e
+
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta and delta.content:
+                    yield delta.content
+        except OpenAIError as e:
+            raise DTAError(f"DTA Proxy request failed: {e}") from e
+        finally:
+            stream.close()
 
     def chat_completion(
         self,
@@ -56,6 +403,7 @@ class DTAProxyClient:
         temperature: float = 0.3,
         max_tokens: int = 4000,
         timeout: Optional[int] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Send a chat completion request.
@@ -66,10 +414,28 @@ class DTAProxyClient:
             temperature: Sampling temperature (0-2).
             max_tokens: Maximum tokens in response.
             timeout: Request timeout in seconds.
+            use_cache: Serve and store the response through a
+                content-addressed disk cache, so re-running the exact same
+                prompt skips the LLM round-trip entirely.
 
         Returns:
             Response content as string.
         """
+        cache_path = None
+        if use_cache and settings.cache_enabled:
+            key = hashlib.sha256(
+                f"{self.model}\0{temperature}\0{max_tokens}\0"
+                f"{system_prompt}\0{user_content}".encode()
+            ).hexdigest()
+            try:
+                cache_dir = settings.ensure_cache_dir() / "llm"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_path = cache_dir / f"{key[:32]}.txt"
+                if cache_path.exists():
+                    return cache_path.read_text(encoding="utf-8")
+            except OSError:
+                cache_path = None
+
         timeout = timeout or settings.llm_timeout
 
         response = self.client.chat.completions.create(
@@ -82,8 +448,15 @@ class DTAProxyClient:
             max_tokens=max_tokens,
             timeout=timeout,
         )
+        content = response.choices[0].message.content or ""
 
-        return response.choices[0].message.content or ""
+        if cache_path is not None and content:
+            try:
+                cache_path.write_text(content, encoding="utf-8")
+            except OSError:
+                pass
+
+        return content
 
     def describe_image(
         self,
@@ -106,14 +479,75 @@ class DTAProxyClient:
         Returns:
             Description of the image.
         """
-        timeout = timeout or settings.vision_timeout
-
         # Encode image to base64
         image_base64 = base64.b64encode(image_data).decode("utf-8")
+        return self._describe_b64(
+            image_base64, mime_type, prompt, max_tokens, timeout,
+            cache_payload=image_data,
+        )
+
+    def _describe_b64(
+        self,
+        image_base64: str,
+        mime_type: str,
+        prompt: str,
+        max_tokens: int,
+        timeout: Optional[int],
+        cache_payload: Optional[bytes] = None,
+    ) -> str:
+        """
+        Send one base64-encoded image to the model, with an on-disk cache.
+
+        When caching is enabled, the response is stored under a SHA-256 of
+        (model, image bytes, prompt, max_tokens) in the cache directory, so
+        repeated runs over the same MIT skip the vision API entirely.
+        """
+        cache_path = self._vision_cache_path(cache_payload, prompt, max_tokens)
+        cached = _read_vision_cache(cache_path)
+        if cached is not None:
+            return cached
 
         response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
+            **self._build_vision_kwargs(image_base64, mime_type, prompt, max_tokens, timeout)
+        )
+        description = response.choices[0].message.content or ""
+
+        _write_vision_cache(cache_path, description)
+        return description
+
+    def _vision_cache_path(
+        self,
+        cache_payload: Optional[bytes],
+        prompt: str,
+        max_tokens: int,
+    ) -> Optional[Path]:
+        """Cache file for a vision response, or None when caching is off."""
+        if cache_payload is None or not settings.cache_enabled:
+            return None
+        digest = hashlib.sha256()
+        digest.update(self.model.encode())
+        digest.update(cache_payload)
+        digest.update(prompt.encode())
+        digest.update(str(max_tokens).encode())
+        try:
+            cache_dir = settings.ensure_cache_dir() / "vision"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        return cache_dir / f"{digest.hexdigest()[:32]}.json"
+
+    def _build_vision_kwargs(
+        self,
+        image_base64: str,
+        mime_type: str,
+        prompt: str,
+        max_tokens: int,
+        timeout: Optional[int],
+    ) -> dict:
+        """Build the kwargs shared by sync and async image descriptions."""
+        return {
+            "model": self.model,
+            "messages": [
                 {
                     "role": "user",
                     "content": [
@@ -125,11 +559,133 @@ class DTAProxyClient:
                     ],
                 }
             ],
+            "max_tokens": max_tokens,
+            "timeout": timeout or settings.vision_timeout,
+        }
+
+    def describe_images(
+        self,
+        image_datas: list[bytes],
+        prompt: str,
+        mime_type: str = "image/png",
+        max_tokens: int = 4000,
+        timeout: Optional[int] = None,
+        mime_types: Optional[list[str]] = None,
+    ) -> list[str]:
+        """
+        Describe several images in a single multi-image chat completion.
+
+        One request amortizes the HTTP round-trip and prompt prefill across
+        the whole batch. Each image is preceded by an [IMG k] marker and the
+        model is asked to echo the markers; the combined answer is split back
+        into per-image descriptions. Images whose marker is missing from the
+        response fall back to an individual describe_image call.
+
+        Args:
+            image_datas: Raw image bytes, one entry per image.
+            prompt: Prompt describing what to analyze in each image.
+            mime_type: MIME type shared by all images.
+            max_tokens: Maximum tokens in response.
+            timeout: Request timeout in seconds.
+            mime_types: Optional per-image MIME types; overrides mime_type.
+
+        Returns:
+            List of descriptions, in the same order as image_datas.
+        """
+        if not image_datas:
+            return []
+
+        def mime_for(k: int) -> str:
+            return mime_types[k] if mime_types else mime_type
+
+        if len(image_datas) == 1:
+            return [
+                self.describe_image(
+                    image_datas[0], prompt, mime_for(0), max_tokens, timeout
+                )
+            ]
+
+        timeout = timeout or settings.vision_timeout
+
+        content: list[dict] = []
+        for k, image_data in enumerate(image_datas):
+            image_base64 = base64.b64encode(image_data).decode("utf-8")
+            content.append({"type": "text", "text": f"[IMG {k}]"})
+            content.append(
+                {
+                    "type": "image_url",
+                    "image_url": {"url": f"data:{mime_for(k)};base64,{image_base64}"},
+                }
+            )
+        content.append(
+            {
+                "type": "text",
+                "text": (
+                    f"{prompt}\n\n"
+                    "Analise CADA imagem acima separadamente. Inicie a analise "
+                    "de cada uma com o marcador correspondente em uma linha "
+                    "propria ([IMG 0], [IMG 1], ...)."
+                ),
+            }
+        )
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": content}],
             max_tokens=max_tokens,
             timeout=timeout,
         )
+        text = response.choices[0].message.content or ""
+
+        descriptions = self._split_image_markers(text, len(image_datas))
+        for k, description in enumerate(descriptions):
+            if not description:
+                descriptions[k] = self.describe_image(
+                    image_datas[k], prompt, mime_for(k), max_tokens, timeout
+                )
+        return descriptions
+
+    @staticmethod
+    def _split_image_markers(text: str, count: int) -> list[str]:
+        """Split a combined multi-image answer into per-image descriptions."""
+        descriptions = [""] * count
+        matches = list(_IMG_MARKER_RE.finditer(text))
+        for i, match in enumerate(matches):
+            k = int(match.group(1))
+            if k >= count:
+                continue
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            descriptions[k] = text[match.end() : end].strip()
+        return descriptions
+
+    async def adescribe_image(
+        self,
+        image_data: bytes,
+        prompt: str,
+        mime_type: str = "image/png",
+        max_tokens: int = 500,
+        timeout: Optional[int] = None,
+    ) -> str:
+        """
+        Async variant of describe_image.
+
+        Shares the on-disk response cache with the sync path; independent
+        awaits run concurrently on the shared async client, which is what
+        lets a diagram-heavy document fan out its vision calls.
+        """
+        cache_path = self._vision_cache_path(image_data, prompt, max_tokens)
+        cached = _read_vision_cache(cache_path)
+        if cached is not None:
+            return cached
+
+        image_base64 = base64.b64encode(image_data).decode("utf-8")
+        response = await self.aclient.chat.completions.create(
+            **self._build_vision_kwargs(image_base64, mime_type, prompt, max_tokens, timeout)
+        )
+        description = response.choices[0].message.content or ""
 
-        return response.choices[0].message.content or ""
+        _write_vision_cache(cache_path, description)
+        return description
 
     def describe_image_from_path(
         self,
@@ -150,26 +706,38 @@ class DTAProxyClient:
         Returns:
             Description of the image.
         """
-        # Determine MIME type from extension
-        extension = image_path.suffix.lower()
-        mime_types = {
-            ".png": "image/png",
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-        }
-        mime_type = mime_types.get(extension, "image/png")
-
-        image_data = image_path.read_bytes()
-        return self.describe_image(
-            image_data=image_data,
-            prompt=prompt,
-            mime_type=mime_type,
-            max_tokens=max_tokens,
-            timeout=timeout,
+        # MIME detection, hashing and base64 encoding are memoized per
+        # (path, mtime); the precomputed digest keys the response cache
+        # without rehashing the multi-MB payload.
+        mime_type, image_base64, sha256_hex = _encode_image(
+            str(image_path), image_path.stat().st_mtime_ns
+        )
+        return self._describe_b64(
+            image_base64, mime_type, prompt, max_tokens, timeout,
+            cache_payload=sha256_hex.encode("ascii"),
         )
 
+    @staticmethod
+    def run_batch(coros: list) -> list:
+        """
+        Run independent client coroutines concurrently from sync code.
+
+        Exceptions come back in-place (return_exceptions=True) so one failed
+        call does not discard the rest of the batch.
+
+        Args:
+            coros: Coroutines, e.g. from adescribe_image or
+                achat_completion_with_metadata.
+
+        Returns:
+            Results in input order; failed entries are the raised exceptions.
+        """
+
+        async def _gather() -> list:
+            return await asyncio.gather(*coros, return_exceptions=True)
+
+        return asyncio.run(_gather())
+
     def test_connection(self) -> bool:
         """
         Test connection to DTA Proxy.
@@ -183,6 +751,9 @@ class DTAProxyClient:
                 user_content="Say 'OK' if you can hear me.",
                 max_tokens=10,
                 timeout=30,
+                # A cached answer would report success without touching
+                # the proxy, which defeats the connectivity probe.
+                use_cache=False,
             )
             return "OK" in response.upper()
         except Exception:
@@ -4,11 +4,17 @@ Pydantic schemas for Avaliador de MITs.
 Defines data models for evaluation results, extraction results, and metadata.
 """
 
+import bisect
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Verdict bands in ascending score order; bisect finds the band with one
+# C-level search instead of a float-compare cascade per access.
+_VERDICT_KEYS = (5.0, 8.0, 9.0)
+_VERDICT_LABELS = ("REPROVADO", "REQUER REVISAO", "APROVADO", "EXCELENTE")
 
 
 class MITType(str, Enum):
@@ -24,6 +30,8 @@ class MITType(str, Enum):
 class DiagramDescription(BaseModel):
     """Description of a diagram extracted from the document."""
 
+    model_config = ConfigDict(frozen=True)
+
     index: int = Field(..., description="Index of the diagram in the document")
     description: str = Field(..., description="Text description of the diagram content")
     diagram_type: Optional[str] = Field(
@@ -34,6 +42,8 @@ class DiagramDescription(BaseModel):
 class ExtractionMetadata(BaseModel):
     """Metadata about the document extraction process."""
 
+    model_config = ConfigDict(frozen=True)
+
     word_count: int = Field(..., description="Total word count of the document")
     image_count: int = Field(..., description="Total number of images in the document")
     relevant_images: int = Field(..., description="Number of relevant images (diagrams) processed")
@@ -47,6 +57,8 @@ class ExtractionMetadata(BaseModel):
 class ExtractionResult(BaseModel):
     """Result of document extraction."""
 
+    model_config = ConfigDict(frozen=True)
+
     markdown: str = Field(..., description="Full document content in Markdown format")
     diagrams: list[DiagramDescription] = Field(
         default_factory=list, description="List of diagram descriptions"
@@ -62,6 +74,8 @@ class ExtractionResult(BaseModel):
 class PillarScore(BaseModel):
     """Score for a single evaluation pillar."""
 
+    model_config = ConfigDict(frozen=True)
+
     pillar_id: str = Field(..., description="Unique identifier for the pillar")
     pillar_name: str = Field(..., description="Human-readable name of the pillar")
     weight: float = Field(..., ge=0, le=1, description="Weight of this pillar (0-1)")
@@ -69,9 +83,16 @@ class PillarScore(BaseModel):
     max_score: float = Field(default=10.0, description="Maximum possible score")
 
 
+# Built once at import; validates a whole list of pillar dicts in a single
+# pydantic-core call instead of one model construction per element.
+_PILLAR_LIST_ADAPTER = TypeAdapter(list[PillarScore])
+
+
 class EvaluationMetadata(BaseModel):
     """Metadata about the evaluation process."""
 
+    model_config = ConfigDict(frozen=True)
+
     mit_type: MITType = Field(..., description="Type of MIT document evaluated")
     document_name: str = Field(..., description="Name of the evaluated document")
     word_count: int = Field(..., description="Word count of the document")
@@ -87,6 +108,14 @@ class EvaluationMetadata(BaseModel):
         default=None, description="Detailed scores per pillar"
     )
 
+    @classmethod
+    def from_raw(cls, *, pillar_scores_raw: list[dict], **kwargs) -> "EvaluationMetadata":
+        """Build metadata validating raw pillar-score dicts in one batch."""
+        return cls(
+            **kwargs,
+            pillar_scores=_PILLAR_LIST_ADAPTER.validate_python(pillar_scores_raw),
+        )
+
 
 class EvaluationResult(BaseModel):
     """
@@ -118,14 +147,7 @@ class EvaluationResult(BaseModel):
     @property
     def verdict(self) -> str:
         """Get human-readable verdict based on score."""
-        if self.score >= 9.0:
-            return "EXCELENTE"
-        elif self.score >= 8.0:
-            return "APROVADO"
-        elif self.score >= 5.0:
-            return "REQUER REVISAO"
-        else:
-            return "REPROVADO"
+        return _VERDICT_LABELS[bisect.bisect_right(_VERDICT_KEYS, self.score)]
 
     def to_simple_dict(self) -> dict:
         """Return simplified dict with only score and recommendations."""